@@ -9,23 +9,135 @@ Analyzes remote React job data from CSV file to extract:
 
 import pandas as pd
 import numpy as np
+import io
+import multiprocessing
+import os
 import re
-from collections import Counter
+import heapq
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, wraps
+import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
-from typing import List, Dict, Tuple, Optional
+from typing import Dict, Tuple, Optional
+
+# Plot style, applied only while drawing; the seaborn-v0_8 style only exists from matplotlib 3.6
+_PLOT_STYLE = 'seaborn-v0_8' if 'seaborn-v0_8' in plt.style.available else []
+
+# Columns used by the analysis and the dtypes to read them with
+CSV_COLUMNS = ['Job Title', 'Company', 'Salary Range', 'Location', 'Job Type', 'Required Skills', 'Source']
+CSV_DTYPES = {
+    'Job Type': 'category',
+    'Source': 'category',
+    'Location': 'category'
+}
+
+# Files larger than this are analyzed chunk by chunk instead of loaded into memory
+STREAMING_THRESHOLD_BYTES = 200 * 1024 * 1024
+STREAMING_CHUNKSIZE = 100_000
+_DISTRIBUTION_COLUMNS = ['Job Type', 'Location', 'Source', 'Company']
+
+# Patterns used on every row, compiled once at import time
+_CURRENCY_RE = re.compile(r'[$,]')
+# Salary amount and pay period, matched in one pass. The period may appear anywhere;
+# the amount is the first range in the string, else the first "+" value, else the first number
+_SALARY_RE = re.compile(
+    r'^(?=(?:.*?/(?P<per>hour|month|week))?)'
+    r'(?:.*?(?P<lo>\d+(?:\.\d+)?)\s*[-–]\s*(?P<hi>\d+(?:\.\d+)?)'
+    r'|.*?(?P<plus>\d+(?:\.\d+)?)\+'
+    r'|.*?(?P<single>\d+(?:\.\d+)?))',
+    re.DOTALL
+)
+_SKILL_SPLIT_RE = re.compile(r'[,;]')
+_SKILL_CLEAN_RE = re.compile(r'[^\w\s+#.]')
+
+_PERIODS = {
+    "hour": "hourly",
+    "month": "monthly",
+    "week": "weekly"
+}
+
+_YEARLY_MULTIPLIERS = {
+    "hourly": 2080,  # 40 hours/week * 52 weeks
+    "weekly": 52,
+    "monthly": 12,
+    "yearly": 1
+}
+
+# Salary periods as int8 codes, indexing into the yearly multiplier table
+_PERIOD_NAMES = np.array(list(_YEARLY_MULTIPLIERS))
+_PERIOD_CODES = {name: i for i, name in enumerate(_YEARLY_MULTIPLIERS)}
+# Pay-period suffixes ("hour", "week", ...) mapped straight to their codes
+_SUFFIX_CODES = {suffix: _PERIOD_CODES[period] for suffix, period in _PERIODS.items()}
+_PERIOD_MULTIPLIERS = np.array(list(_YEARLY_MULTIPLIERS.values()), dtype=np.float64)
+
+def _normalize_salaries(mins, maxs, period, mult):
+    """Convert min/max salaries to yearly figures and their midpoint."""
+    m = mult[period]
+    min_yearly = mins * m
+    max_yearly = maxs * m
+    return min_yearly, max_yearly, (min_yearly + max_yearly) / 2
+
+# Normalize common variations of skill names
+SKILL_MAPPINGS = {
+    'reactjs': 'react',
+    'react js': 'react',
+    'react.js': 'react',
+    'javascript': 'javascript',
+    'js': 'javascript',
+    'typescript': 'typescript',
+    'ts': 'typescript',
+    'nodejs': 'node.js',
+    'node js': 'node.js',
+    'nextjs': 'next.js',
+    'next js': 'next.js',
+    'react native': 'react native',
+    'html5': 'html',
+    'css3': 'css'
+}
+
+def _cached_analysis(method):
+    """Cache an analysis method's result on the instance until self.df is reloaded or replaced."""
+    @wraps(method)
+    def wrapper(self):
+        if method.__name__ not in self._cache:
+            self._cache[method.__name__] = method(self)
+        return self._cache[method.__name__]
+    return wrapper
 
 class ReactJobsAnalyzer:
-    def __init__(self, csv_path: str):
-        """Initialize the analyzer with CSV data."""
+    def __init__(self, csv_path: str, load: bool = True):
+        """Initialize the analyzer with CSV data (pass load=False for streaming analysis)."""
         self.csv_path = csv_path
         self.df = None
-        self.load_data()
+        self._figure = None
+        if load:
+            self.load_data()
+    
+    @property
+    def df(self) -> Optional[pd.DataFrame]:
+        """The loaded job data."""
+        return self._df
+    
+    @df.setter
+    def df(self, value: Optional[pd.DataFrame]):
+        # Cached analyses belong to the previous frame
+        self._df = value
+        self._cache = {}
     
     def load_data(self):
         """Load and clean the CSV data."""
+        # Drop anything computed from previously loaded data
+        self._cache = {}
+        
         try:
-            self.df = pd.read_csv(self.csv_path)
+            try:
+                self.df = pd.read_csv(self.csv_path, usecols=CSV_COLUMNS, dtype=CSV_DTYPES,
+                                      engine='pyarrow', dtype_backend='pyarrow')
+            except ImportError:
+                # pyarrow is optional, fall back to the default C parser
+                self.df = pd.read_csv(self.csv_path, usecols=CSV_COLUMNS, dtype=CSV_DTYPES, engine='c')
             print(f"Loaded {len(self.df)} job records")
             print(f"Columns: {list(self.df.columns)}")
         except FileNotFoundError:
@@ -35,171 +147,216 @@ class ReactJobsAnalyzer:
             print(f"Error loading data: {e}")
             return
     
-    def parse_salary(self, salary_str: str) -> Tuple[Optional[float], Optional[float], str]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def parse_salary(salary_str: str) -> Tuple[Optional[float], Optional[float], str]:
         """
         Parse salary string and return (min_salary, max_salary, period).
         Returns None values if salary cannot be parsed.
+        Results are cached, so repeated salary strings are only parsed once.
+        
+        >>> ReactJobsAnalyzer.parse_salary('$80,000 - $100,000')
+        (80000.0, 100000.0, 'yearly')
+        >>> ReactJobsAnalyzer.parse_salary('Up to 5 years, $100-120')
+        (100.0, 120.0, 'yearly')
+        >>> ReactJobsAnalyzer.parse_salary('$80+ or 90-100')
+        (90.0, 100.0, 'yearly')
+        >>> ReactJobsAnalyzer.parse_salary('Paid /hour: $40+')
+        (40.0, None, 'hourly')
+        >>> ReactJobsAnalyzer.parse_salary('$5,000/month')
+        (5000.0, 5000.0, 'monthly')
+        >>> ReactJobsAnalyzer.parse_salary('Competitive')
+        (None, None, 'unknown')
         """
         if pd.isna(salary_str) or salary_str == "Not specified":
             return None, None, "unknown"
         
         # Remove currency symbols and clean the string
-        clean_salary = re.sub(r'[$,]', '', str(salary_str))
+        clean_salary = _CURRENCY_RE.sub('', str(salary_str))
+        
+        match = _SALARY_RE.match(clean_salary)
+        if not match:
+            return None, None, "unknown"
         
         # Determine period (hourly, monthly, yearly)
-        period = "yearly"
-        if "/hour" in salary_str:
-            period = "hourly"
-        elif "/month" in salary_str:
-            period = "monthly"
-        elif "/week" in salary_str:
-            period = "weekly"
-        
-        # Extract numeric ranges
-        range_match = re.search(r'(\d+(?:\.\d+)?)\s*[-–]\s*(\d+(?:\.\d+)?)', clean_salary)
-        if range_match:
-            min_sal = float(range_match.group(1))
-            max_sal = float(range_match.group(2))
-            return min_sal, max_sal, period
-        
-        # Extract single values with + indicator
-        plus_match = re.search(r'(\d+(?:\.\d+)?)\+', clean_salary)
-        if plus_match:
-            min_sal = float(plus_match.group(1))
-            return min_sal, None, period
-        
-        # Extract single numeric value
-        single_match = re.search(r'(\d+(?:\.\d+)?)', clean_salary)
-        if single_match:
-            salary = float(single_match.group(1))
-            return salary, salary, period
-        
-        return None, None, "unknown"
+        period = _PERIODS.get(match.group('per'), "yearly")
+        
+        if match.group('hi'):
+            # Numeric range
+            return float(match.group('lo')), float(match.group('hi')), period
+        if match.group('plus'):
+            # Single value with + indicator
+            return float(match.group('plus')), None, period
+        salary = float(match.group('single'))
+        return salary, salary, period
     
     def normalize_to_yearly(self, salary: float, period: str) -> float:
         """Convert salary to yearly equivalent."""
         if salary is None:
             return None
         
-        multipliers = {
-            "hourly": 2080,  # 40 hours/week * 52 weeks
-            "weekly": 52,
-            "monthly": 12,
-            "yearly": 1
-        }
+        return salary * _YEARLY_MULTIPLIERS.get(period, 1)
+    
+    @staticmethod
+    def _parse_salary_column(salary_col: pd.Series) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized parse_salary + normalize_to_yearly over a whole column.
+        Returns (min_yearly, max_yearly, avg_yearly, period) arrays, NaN where no salary was found.
+        """
+        # Salary strings repeat heavily, so parse each distinct value once
+        codes, uniques = pd.factorize(salary_col)
+        salaries = pd.Series(uniques).astype(str)
+        
+        # Remove currency symbols, then extract amount and period in a single pass
+        clean_salary = salaries.str.replace(_CURRENCY_RE, '', regex=True)
+        match = clean_salary.str.extract(_SALARY_RE)
+        
+        # Period (hourly, weekly, monthly, yearly) as int8 codes
+        period = match['per'].map(_SUFFIX_CODES).fillna(_PERIOD_CODES['yearly']).to_numpy(dtype=np.int8)
+        
+        min_sal = match['lo'].fillna(match['plus']).fillna(match['single']).astype(float).to_numpy(dtype=np.float64)
+        # Single and "+" salaries have no upper bound, so fall back to the minimum
+        max_sal = match['hi'].astype(float).to_numpy(dtype=np.float64)
+        max_sal = np.where(max_sal > 0, max_sal, min_sal)
+        
+        min_yearly, max_yearly, avg_yearly = _normalize_salaries(min_sal, max_sal, period, _PERIOD_MULTIPLIERS)
+        period_names = np.where(np.isnan(min_sal), 'unknown', _PERIOD_NAMES[period])
+        
+        # Broadcast the per-value results back to every row; missing salaries have
+        # code -1, which picks the trailing "no salary" entry
+        min_yearly, max_yearly, avg_yearly = (np.append(values, np.nan) for values in (min_yearly, max_yearly, avg_yearly))
+        period_names = np.append(period_names, 'unknown')
+        return min_yearly[codes], max_yearly[codes], avg_yearly[codes], period_names[codes]
+    
+    def _ensure_parsed(self):
+        """Parse the salary column once and store yearly figures on the DataFrame."""
+        # Check the columns themselves so a reassigned self.df is parsed again
+        if '_avg_yearly' in self.df:
+            return
         
-        return salary * multipliers.get(period, 1)
+        min_yearly, max_yearly, avg_yearly, period = self._parse_salary_column(self.df['Salary Range'])
+        self.df['_min_yearly'] = min_yearly
+        self.df['_max_yearly'] = max_yearly
+        self.df['_avg_yearly'] = avg_yearly
+        self.df['_period'] = period
     
+    @_cached_analysis
     def analyze_salaries(self) -> Dict:
         """Analyze salary data and return statistics."""
         if self.df is None:
             return {}
         
-        salary_data = []
-        
-        for _, row in self.df.iterrows():
-            min_sal, max_sal, period = self.parse_salary(row['Salary Range'])
-            
-            if min_sal is not None:
-                yearly_min = self.normalize_to_yearly(min_sal, period)
-                yearly_max = self.normalize_to_yearly(max_sal if max_sal else min_sal, period)
-                
-                salary_data.append({
-                    'job_title': row['Job Title'],
-                    'company': row['Company'],
-                    'min_yearly': yearly_min,
-                    'max_yearly': yearly_max,
-                    'avg_yearly': (yearly_min + yearly_max) / 2,
-                    'original_period': period,
-                    'job_type': row['Job Type']
-                })
-        
-        if not salary_data:
+        self._ensure_parsed()
+        valid = self.df['_avg_yearly'].notna()
+        if not valid.any():
             return {"error": "No valid salary data found"}
         
-        salary_df = pd.DataFrame(salary_data)
+        # Work on the parsed columns of self.df directly; NaN rows have no salary
+        avg_yearly = self.df.loc[valid, '_avg_yearly']
+        by_job_type = avg_yearly.groupby(self.df.loc[valid, 'Job Type'], observed=True)
+        top_paying = self.df.loc[avg_yearly.nlargest(10).index, ['Job Title', 'Company', '_avg_yearly']]
+        top_paying.columns = ['job_title', 'company', 'avg_yearly']
         
         return {
-            "total_jobs_with_salary": len(salary_df),
-            "avg_salary": salary_df['avg_yearly'].mean(),
-            "median_salary": salary_df['avg_yearly'].median(),
-            "min_salary": salary_df['min_yearly'].min(),
-            "max_salary": salary_df['max_yearly'].max(),
-            "salary_by_job_type": salary_df.groupby('job_type')['avg_yearly'].agg(['mean', 'median', 'count']).to_dict(),
-            "top_paying_jobs": salary_df.nlargest(10, 'avg_yearly')[['job_title', 'company', 'avg_yearly']].to_dict('records')
+            "total_jobs_with_salary": len(avg_yearly),
+            "avg_salary": avg_yearly.mean(),
+            "median_salary": avg_yearly.median(),
+            "min_salary": self.df['_min_yearly'].min(),
+            "max_salary": self.df['_max_yearly'].max(),
+            "salary_by_job_type": by_job_type.agg(['mean', 'median', 'count']).to_dict(),
+            "top_paying_jobs": top_paying.to_dict('records')
         }
     
-    def extract_skills(self, skills_str: str) -> List[str]:
-        """Extract individual skills from the skills string."""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def extract_skills(skills_str: str) -> Tuple[str, ...]:
+        """Extract individual skills from the skills string (cached per string)."""
         if pd.isna(skills_str):
-            return []
+            return ()
         
         # Split by common delimiters and clean
-        skills = re.split(r'[,;]', str(skills_str))
+        skills = _SKILL_SPLIT_RE.split(str(skills_str))
         cleaned_skills = []
         
         for skill in skills:
             # Clean and normalize skill names
             clean_skill = skill.strip().lower()
-            clean_skill = re.sub(r'[^\w\s+#.]', '', clean_skill)
+            clean_skill = _SKILL_CLEAN_RE.sub('', clean_skill)
             
             if clean_skill and len(clean_skill) > 1:
-                # Normalize common variations
-                skill_mappings = {
-                    'reactjs': 'react',
-                    'react js': 'react',
-                    'react.js': 'react',
-                    'javascript': 'javascript',
-                    'js': 'javascript',
-                    'typescript': 'typescript',
-                    'ts': 'typescript',
-                    'nodejs': 'node.js',
-                    'node js': 'node.js',
-                    'nextjs': 'next.js',
-                    'next js': 'next.js',
-                    'react native': 'react native',
-                    'html5': 'html',
-                    'css3': 'css'
-                }
-                
-                normalized_skill = skill_mappings.get(clean_skill, clean_skill)
+                normalized_skill = SKILL_MAPPINGS.get(clean_skill, clean_skill)
                 cleaned_skills.append(normalized_skill)
         
-        return cleaned_skills
+        return tuple(cleaned_skills)
     
+    @staticmethod
+    def _count_skills(skills_col: pd.Series) -> Tuple[Counter, Counter, int, int]:
+        """
+        Count skills and skill combinations in a Required Skills column.
+        Returns (skill_counter, combo_counter, total_skills_mentioned, jobs_with_skills).
+        """
+        # Skill lists are copy-pasted across postings, so parse each distinct value once
+        # and weight its results by how many rows share it
+        codes, uniques = pd.factorize(skills_col.dropna())
+        occurrences = np.bincount(codes, minlength=len(uniques))
+        if not len(uniques):
+            return Counter(), Counter(), 0, 0
+        
+        # Split every distinct value into one skill per element, keeping its position in uniques
+        skills = pd.Series(uniques).astype(str).str.split(_SKILL_SPLIT_RE).explode()
+        skills = skills.str.strip().str.lower().str.replace(_SKILL_CLEAN_RE, '', regex=True)
+        skills = skills[skills.str.len() > 1]
+        
+        # Normalize each distinct skill once, then broadcast through the category codes
+        categories = pd.Categorical(skills)
+        lut = np.array([SKILL_MAPPINGS.get(c, c) for c in categories.categories], dtype=object)
+        skills = pd.Series(lut[categories.codes], index=skills.index)
+        weights = pd.Series(occurrences[skills.index], index=skills.to_numpy())
+        
+        skill_counter = Counter(weights.groupby(level=0, sort=False).sum().to_dict())
+        
+        # Skills grouped back per distinct skill list
+        skill_combinations = skills.groupby(level=0, sort=False).agg(tuple)
+        combination_counts = occurrences[skill_combinations.index]
+        
+        # Find common skill combinations, sorting each distinct skill list only once
+        tuple_counter = Counter()
+        for skills_tuple, count in zip(skill_combinations, combination_counts):
+            tuple_counter[skills_tuple] += int(count)
+        
+        combo_counter = Counter()
+        for skills_tuple, count in tuple_counter.items():
+            if len(skills_tuple) >= 2:
+                # Sort skills to normalize combinations
+                combo_counter[tuple(sorted(skills_tuple))] += count
+        
+        return skill_counter, combo_counter, int(weights.sum()), int(combination_counts.sum())
+    
+    @_cached_analysis
     def analyze_skills(self) -> Dict:
         """Analyze skill requirements and return statistics."""
         if self.df is None:
             return {}
         
-        all_skills = []
-        skill_combinations = []
-        
-        for _, row in self.df.iterrows():
-            skills = self.extract_skills(row['Required Skills'])
-            all_skills.extend(skills)
-            if skills:
-                skill_combinations.append(skills)
-        
-        skill_counter = Counter(all_skills)
-        
-        # Find common skill combinations
-        combo_counter = Counter()
-        for skills in skill_combinations:
-            if len(skills) >= 2:
-                # Sort skills to normalize combinations
-                sorted_skills = tuple(sorted(skills))
-                combo_counter[sorted_skills] += 1
+        return self._summarize_skills(*self._count_skills(self.df['Required Skills']))
+    
+    @staticmethod
+    def _summarize_skills(skill_counter: Counter, combo_counter: Counter, total_skills: int,
+                          jobs_with_skills: int) -> Dict:
+        """Build the skills analysis from skill and combination counts."""
+        # One top-20 selection serves both the top skills and the top-15 percentages
+        most_common_skills = skill_counter.most_common(20)
         
         return {
-            "total_skills_mentioned": len(all_skills),
+            "total_skills_mentioned": total_skills,
             "unique_skills": len(skill_counter),
-            "most_common_skills": skill_counter.most_common(20),
-            "skill_frequency_percent": {skill: (count/len(skill_combinations))*100 
-                                     for skill, count in skill_counter.most_common(15)},
+            "most_common_skills": most_common_skills,
+            "skill_frequency_percent": {skill: (count/jobs_with_skills)*100 
+                                     for skill, count in most_common_skills[:15]},
             "common_skill_combinations": combo_counter.most_common(10)
         }
     
+    @_cached_analysis
     def analyze_job_distribution(self) -> Dict:
         """Analyze job distribution by various factors."""
         if self.df is None:
@@ -212,58 +369,157 @@ class ReactJobsAnalyzer:
             "companies_with_most_jobs": self.df['Company'].value_counts().head(10).to_dict()
         }
     
-    def generate_visualizations(self):
+    def analyze_streaming(self, chunksize: int = STREAMING_CHUNKSIZE, workers: Optional[int] = None) -> Dict:
+        """
+        Analyze the CSV chunk by chunk without keeping the whole file in memory.
+        Chunks are summarized in parallel by `workers` processes (default: one per CPU, 1 runs
+        serially) and merged in file order.
+        Returns total_jobs plus salary, skills and distribution results shaped like the
+        in-memory analyses; the salary median is replaced by a running standard deviation.
+        """
+        workers = workers or os.cpu_count() or 1
+        
+        total_jobs = 0
+        distribution = {column: Counter() for column in _DISTRIBUTION_COLUMNS}
+        skill_counter, combo_counter = Counter(), Counter()
+        total_skills = jobs_with_skills = 0
+        
+        # Welford accumulators for the yearly average salary
+        salary_count, salary_mean, salary_m2 = 0, 0.0, 0.0
+        min_salary, max_salary = np.inf, -np.inf
+        top_paying_jobs = []
+        
+        def merge(summary):
+            nonlocal total_jobs, total_skills, jobs_with_skills
+            nonlocal salary_count, salary_mean, salary_m2, min_salary, max_salary, top_paying_jobs
+            
+            total_jobs += summary['jobs']
+            for column, counter in distribution.items():
+                counter.update(summary['distribution'][column])
+            skill_counter.update(summary['skills'])
+            combo_counter.update(summary['combinations'])
+            total_skills += summary['total_skills']
+            jobs_with_skills += summary['jobs_with_skills']
+            
+            count = summary['salary_count']
+            if not count:
+                return
+            
+            # Merge the chunk's mean/variance into the running totals
+            delta = summary['salary_mean'] - salary_mean
+            new_count = salary_count + count
+            salary_mean += delta * count / new_count
+            salary_m2 += summary['salary_m2'] + delta ** 2 * salary_count * count / new_count
+            salary_count = new_count
+            min_salary = min(min_salary, summary['min_salary'])
+            max_salary = max(max_salary, summary['max_salary'])
+            top_paying_jobs = heapq.nlargest(10, top_paying_jobs + summary['top_paying_jobs'],
+                                             key=lambda job: job['avg_yearly'])
+        
+        try:
+            reader = pd.read_csv(self.csv_path, usecols=CSV_COLUMNS, dtype=CSV_DTYPES, chunksize=chunksize)
+        except FileNotFoundError:
+            print(f"Error: Could not find file {self.csv_path}")
+            return {}
+        except Exception as e:
+            print(f"Error loading data: {e}")
+            return {}
+        
+        with reader:
+            if workers == 1:
+                for chunk in reader:
+                    merge(_summarize_chunk(chunk))
+            else:
+                # Spawn fresh workers instead of forking a parent that may hold running threads
+                with ProcessPoolExecutor(max_workers=workers,
+                                         mp_context=multiprocessing.get_context('spawn')) as executor:
+                    # Keep a bounded number of chunks in flight so memory stays flat
+                    pending = deque()
+                    for chunk in reader:
+                        pending.append(executor.submit(_summarize_chunk, chunk))
+                        if len(pending) >= 2 * workers:
+                            merge(pending.popleft().result())
+                    while pending:
+                        merge(pending.popleft().result())
+        
+        print(f"Streamed {total_jobs} job records")
+        
+        if salary_count:
+            salary_analysis = {
+                "total_jobs_with_salary": salary_count,
+                "avg_salary": salary_mean,
+                "salary_std": np.sqrt(salary_m2 / (salary_count - 1)) if salary_count > 1 else np.nan,
+                "min_salary": min_salary,
+                "max_salary": max_salary,
+                "top_paying_jobs": top_paying_jobs
+            }
+        else:
+            salary_analysis = {"error": "No valid salary data found"}
+        
+        return {
+            "total_jobs": total_jobs,
+            "salary": salary_analysis,
+            "skills": self._summarize_skills(skill_counter, combo_counter, total_skills, jobs_with_skills),
+            "distribution": {
+                "job_type_distribution": dict(distribution['Job Type'].most_common()),
+                "location_distribution": dict(distribution['Location'].most_common()),
+                "source_distribution": dict(distribution['Source'].most_common()),
+                "companies_with_most_jobs": dict(distribution['Company'].most_common(10))
+            }
+        }
+    
+    def generate_visualizations(self, dpi: int = 150):
         """Generate and save visualization plots."""
         if self.df is None:
             return
         
-        # Set up the plotting style
-        plt.style.use('seaborn-v0_8')
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
-        fig.suptitle('Remote React Jobs Analysis', fontsize=16, fontweight='bold')
-        
-        # 1. Job Type Distribution
-        job_types = self.df['Job Type'].value_counts()
-        axes[0, 0].pie(job_types.values, labels=job_types.index, autopct='%1.1f%%')
-        axes[0, 0].set_title('Job Type Distribution')
-        
-        # 2. Top Skills
-        skills_analysis = self.analyze_skills()
-        if 'most_common_skills' in skills_analysis:
-            top_skills = skills_analysis['most_common_skills'][:10]
-            skills, counts = zip(*top_skills)
-            axes[0, 1].barh(skills, counts)
-            axes[0, 1].set_title('Top 10 Required Skills')
-            axes[0, 1].set_xlabel('Frequency')
-        
-        # 3. Source Distribution
-        sources = self.df['Source'].value_counts()
-        axes[1, 0].bar(sources.index, sources.values)
-        axes[1, 0].set_title('Jobs by Source')
-        axes[1, 0].set_xlabel('Job Source')
-        axes[1, 0].set_ylabel('Number of Jobs')
-        axes[1, 0].tick_params(axis='x', rotation=45)
-        
-        # 4. Salary Distribution (if available)
-        salary_analysis = self.analyze_salaries()
-        if 'error' not in salary_analysis:
-            # Create salary ranges for histogram
-            salary_data = []
-            for _, row in self.df.iterrows():
-                min_sal, max_sal, period = self.parse_salary(row['Salary Range'])
-                if min_sal:
-                    yearly_avg = self.normalize_to_yearly((min_sal + (max_sal or min_sal))/2, period)
-                    if yearly_avg and yearly_avg < 1000000:  # Filter outliers
-                        salary_data.append(yearly_avg)
+        # Apply the plot style only while drawing so global rcParams stay untouched
+        with plt.style.context(_PLOT_STYLE):
+            # Reuse the figure from a previous call, clearing its axes
+            if self._figure is None:
+                self._figure = plt.subplots(2, 2, figsize=(15, 12))
+            fig, axes = self._figure
+            for ax in axes.flat:
+                ax.clear()
+            fig.suptitle('Remote React Jobs Analysis', fontsize=16, fontweight='bold')
+        
+            # 1. Job Type Distribution
+            job_types = self.df['Job Type'].value_counts()
+            axes[0, 0].pie(job_types.values, labels=job_types.index, autopct='%1.1f%%')
+            axes[0, 0].set_title('Job Type Distribution')
+        
+            # 2. Top Skills
+            skills_analysis = self.analyze_skills()
+            if 'most_common_skills' in skills_analysis:
+                top_skills = skills_analysis['most_common_skills'][:10]
+                skills, counts = zip(*top_skills)
+                axes[0, 1].barh(skills, counts)
+                axes[0, 1].set_title('Top 10 Required Skills')
+                axes[0, 1].set_xlabel('Frequency')
+        
+            # 3. Source Distribution
+            sources = self.df['Source'].value_counts()
+            axes[1, 0].bar(sources.index, sources.values)
+            axes[1, 0].set_title('Jobs by Source')
+            axes[1, 0].set_xlabel('Job Source')
+            axes[1, 0].set_ylabel('Number of Jobs')
+            axes[1, 0].tick_params(axis='x', rotation=45)
+        
+            # 4. Salary Distribution (if available)
+            salary_analysis = self.analyze_salaries()
+            if 'error' not in salary_analysis:
+                # Reuse the parsed salary column for the histogram
+                yearly_avg = self.df['_avg_yearly']
+                salary_data = yearly_avg[(yearly_avg > 0) & (yearly_avg < 1000000)]  # Filter outliers
             
-            if salary_data:
-                axes[1, 1].hist(salary_data, bins=15, edgecolor='black', alpha=0.7)
-                axes[1, 1].set_title('Salary Distribution (Yearly)')
-                axes[1, 1].set_xlabel('Salary ($)')
-                axes[1, 1].set_ylabel('Frequency')
-        
-        plt.tight_layout()
-        plt.savefig('react_jobs_analysis.png', dpi=300, bbox_inches='tight')
+                if len(salary_data):
+                    axes[1, 1].hist(salary_data.to_numpy(), bins=15, edgecolor='black', alpha=0.7)
+                    axes[1, 1].set_title('Salary Distribution (Yearly)')
+                    axes[1, 1].set_xlabel('Salary ($)')
+                    axes[1, 1].set_ylabel('Frequency')
+        
+            fig.tight_layout()
+            fig.savefig('react_jobs_analysis.png', dpi=dpi, bbox_inches='tight')
         print("Visualization saved as 'react_jobs_analysis.png'")
     
     def generate_report(self) -> str:
@@ -271,82 +527,136 @@ class ReactJobsAnalyzer:
         if self.df is None:
             return "Error: No data loaded"
         
-        salary_analysis = self.analyze_salaries()
-        skills_analysis = self.analyze_skills()
-        distribution_analysis = self.analyze_job_distribution()
+        return self._format_report(len(self.df), self.analyze_salaries(), self.analyze_skills(),
+                                   self.analyze_job_distribution())
+    
+    def generate_streaming_report(self, chunksize: int = STREAMING_CHUNKSIZE, workers: Optional[int] = None) -> str:
+        """Generate the text report by streaming the CSV instead of loading it."""
+        results = self.analyze_streaming(chunksize, workers)
+        if not results:
+            return "Error: No data loaded"
         
-        report = []
-        report.append("=" * 60)
-        report.append("REMOTE REACT JOBS ANALYSIS REPORT")
-        report.append("=" * 60)
-        report.append(f"Total Jobs Analyzed: {len(self.df)}")
-        report.append("")
+        return self._format_report(results['total_jobs'], results['salary'], results['skills'],
+                                   results['distribution'])
+    
+    @staticmethod
+    def _format_report(total_jobs: int, salary_analysis: Dict, skills_analysis: Dict,
+                       distribution_analysis: Dict) -> str:
+        """Format analysis results as the text report."""
+        buf = io.StringIO()
+        w = buf.write
+        w("=" * 60 + "\n")
+        w("REMOTE REACT JOBS ANALYSIS REPORT\n")
+        w("=" * 60 + "\n")
+        w(f"Total Jobs Analyzed: {total_jobs}\n")
+        w("\n")
         
         # Salary Analysis
-        report.append("SALARY ANALYSIS")
-        report.append("-" * 20)
+        w("SALARY ANALYSIS\n")
+        w("-" * 20 + "\n")
         if 'error' not in salary_analysis:
-            report.append(f"Jobs with salary info: {salary_analysis['total_jobs_with_salary']}")
-            report.append(f"Average salary: ${salary_analysis['avg_salary']:,.0f}")
-            report.append(f"Median salary: ${salary_analysis['median_salary']:,.0f}")
-            report.append(f"Salary range: ${salary_analysis['min_salary']:,.0f} - ${salary_analysis['max_salary']:,.0f}")
-            report.append("")
+            w(f"Jobs with salary info: {salary_analysis['total_jobs_with_salary']}\n")
+            w(f"Average salary: ${salary_analysis['avg_salary']:,.0f}\n")
+            if 'median_salary' in salary_analysis:
+                w(f"Median salary: ${salary_analysis['median_salary']:,.0f}\n")
+            w(f"Salary range: ${salary_analysis['min_salary']:,.0f} - ${salary_analysis['max_salary']:,.0f}\n")
+            w("\n")
             
-            report.append("Top 5 Highest Paying Jobs:")
+            w("Top 5 Highest Paying Jobs:\n")
             for i, job in enumerate(salary_analysis['top_paying_jobs'][:5], 1):
-                report.append(f"{i}. {job['job_title']} at {job['company']} - ${job['avg_yearly']:,.0f}")
+                w(f"{i}. {job['job_title']} at {job['company']} - ${job['avg_yearly']:,.0f}\n")
         else:
-            report.append("No valid salary data found")
-        report.append("")
+            w("No valid salary data found\n")
+        w("\n")
         
         # Skills Analysis
-        report.append("SKILLS ANALYSIS")
-        report.append("-" * 20)
-        report.append(f"Total skills mentioned: {skills_analysis['total_skills_mentioned']}")
-        report.append(f"Unique skills: {skills_analysis['unique_skills']}")
-        report.append("")
+        w("SKILLS ANALYSIS\n")
+        w("-" * 20 + "\n")
+        w(f"Total skills mentioned: {skills_analysis['total_skills_mentioned']}\n")
+        w(f"Unique skills: {skills_analysis['unique_skills']}\n")
+        w("\n")
         
-        report.append("Top 15 Most Required Skills:")
+        w("Top 15 Most Required Skills:\n")
         for i, (skill, count) in enumerate(skills_analysis['most_common_skills'][:15], 1):
             percentage = skills_analysis['skill_frequency_percent'].get(skill, 0)
-            report.append(f"{i:2d}. {skill.title():<20} - {count:3d} jobs ({percentage:.1f}%)")
-        report.append("")
+            w(f"{i:2d}. {skill.title():<20} - {count:3d} jobs ({percentage:.1f}%)\n")
+        w("\n")
         
         # Job Distribution
-        report.append("JOB DISTRIBUTION")
-        report.append("-" * 20)
+        w("JOB DISTRIBUTION\n")
+        w("-" * 20 + "\n")
         
-        report.append("By Job Type:")
+        w("By Job Type:\n")
         for job_type, count in distribution_analysis['job_type_distribution'].items():
-            percentage = (count / len(self.df)) * 100
-            report.append(f"  {job_type}: {count} ({percentage:.1f}%)")
-        report.append("")
+            percentage = (count / total_jobs) * 100
+            w(f"  {job_type}: {count} ({percentage:.1f}%)\n")
+        w("\n")
         
-        report.append("By Source:")
+        w("By Source:\n")
         for source, count in distribution_analysis['source_distribution'].items():
-            percentage = (count / len(self.df)) * 100
-            report.append(f"  {source}: {count} ({percentage:.1f}%)")
-        report.append("")
+            percentage = (count / total_jobs) * 100
+            w(f"  {source}: {count} ({percentage:.1f}%)\n")
+        w("\n")
         
-        report.append("Companies with Most Job Postings:")
+        w("Companies with Most Job Postings:\n")
         for i, (company, count) in enumerate(list(distribution_analysis['companies_with_most_jobs'].items())[:10], 1):
-            report.append(f"{i:2d}. {company}: {count} jobs")
+            w(f"{i:2d}. {company}: {count} jobs\n")
         
-        return "\n".join(report)
+        # No trailing newline after the last line
+        return buf.getvalue().rstrip("\n")
+
+def _summarize_chunk(chunk: pd.DataFrame) -> Dict:
+    """Summarize one CSV chunk for analyze_streaming (module level so worker processes can run it)."""
+    skills, combinations, total_skills, jobs_with_skills = ReactJobsAnalyzer._count_skills(chunk['Required Skills'])
+    summary = {
+        "jobs": len(chunk),
+        "distribution": {column: chunk[column].value_counts(sort=False).to_dict()
+                         for column in _DISTRIBUTION_COLUMNS},
+        "skills": skills,
+        "combinations": combinations,
+        "total_skills": total_skills,
+        "jobs_with_skills": jobs_with_skills,
+        "salary_count": 0
+    }
+    
+    min_yearly, max_yearly, avg_yearly, _ = ReactJobsAnalyzer._parse_salary_column(chunk['Salary Range'])
+    valid = ~np.isnan(avg_yearly)
+    if not valid.any():
+        return summary
+    
+    values = avg_yearly[valid]
+    summary.update({
+        "salary_count": len(values),
+        "salary_mean": values.mean(),
+        "salary_m2": ((values - values.mean()) ** 2).sum(),
+        "min_salary": min_yearly[valid].min(),
+        "max_salary": max_yearly[valid].max(),
+        "top_paying_jobs": pd.DataFrame({
+            'job_title': chunk['Job Title'].to_numpy()[valid],
+            'company': chunk['Company'].to_numpy()[valid],
+            'avg_yearly': values
+        }).nlargest(10, 'avg_yearly').to_dict('records')
+    })
+    return summary
 
 def main():
     """Main function to run the analysis."""
     csv_path = r"d:\Triallies\BrightKiro\remote_react_jobs.csv"
     
     print("Starting React Jobs Analysis...")
-    analyzer = ReactJobsAnalyzer(csv_path)
-    
-    if analyzer.df is None:
-        print("Failed to load data. Exiting.")
-        return
+    # Large files are streamed in chunks instead of being loaded into memory
+    streaming = os.path.isfile(csv_path) and os.path.getsize(csv_path) > STREAMING_THRESHOLD_BYTES
+    analyzer = ReactJobsAnalyzer(csv_path, load=not streaming)
     
-    # Generate comprehensive report
-    report = analyzer.generate_report()
+    if streaming:
+        report = analyzer.generate_streaming_report()
+    else:
+        if analyzer.df is None:
+            print("Failed to load data. Exiting.")
+            return
+        
+        # Generate comprehensive report
+        report = analyzer.generate_report()
     print(report)
     
     # Save report to file
@@ -354,12 +664,14 @@ def main():
         f.write(report)
     print(f"\nDetailed report saved to 'react_jobs_analysis_report.txt'")
     
-    # Generate visualizations
-    try:
-        analyzer.generate_visualizations()
-    except Exception as e:
-        print(f"Could not generate visualizations: {e}")
-        print("Make sure matplotlib and seaborn are installed: pip install matplotlib seaborn")
+    # Generate visualizations (these need the data in memory)
+    if not streaming:
+        try:
+            matplotlib.use('Agg')  # Plots are only saved to file, no interactive backend needed
+            analyzer.generate_visualizations()
+        except Exception as e:
+            print(f"Could not generate visualizations: {e}")
+            print("Make sure matplotlib and seaborn are installed: pip install matplotlib seaborn")
     
     print("\nAnalysis complete!")
 